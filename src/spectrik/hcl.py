@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import sys
 import textwrap
+import threading
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +35,52 @@ _SERIALIZATION_OPTS = SerializationOptions(
 _HEREDOC_RE = re.compile(r"\A<<(-?)([a-zA-Z][a-zA-Z0-9._-]*)\n([\s\S]*)\2\Z")
 
 
+# raw file text keyed by path — (mtime_ns, size, text); unchanged files
+# skip the disk read, and the content-keyed parse memo then skips the parse.
+# Bounded like the parse memo below: least-recently-read paths are evicted
+# so long-lived consumers scanning transient paths cannot grow it forever.
+_TEXT_CACHE_SIZE = 64
+_text_cache: dict[str, tuple[int, int, str]] = {}
+
+# scan() reads files from a thread pool, so every cache read/mutation
+# (recency refresh, eviction, insert) happens under this lock
+_text_cache_lock = threading.Lock()
+
+
+def _read_text(file: Path) -> str:
+    """Read *file*, reusing cached text while mtime and size are unchanged."""
+    key = str(file)
+    stat = file.stat()
+
+    with _text_cache_lock:
+        cached = _text_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            # refresh recency so repeat scans keep their working set cached
+            _text_cache[key] = _text_cache.pop(key)
+            return cached[2]
+
+    # the disk read stays outside the lock so pool threads still overlap
+    text = file.read_text()
+
+    with _text_cache_lock:
+        _text_cache.pop(key, None)
+        while len(_text_cache) >= _TEXT_CACHE_SIZE:
+            del _text_cache[next(iter(_text_cache))]
+        _text_cache[key] = (stat.st_mtime_ns, stat.st_size, text)
+
+    return text
+
+
+@lru_cache(maxsize=64)
+def _parse_text(text: str) -> dict[str, Any]:
+    """Parse raw HCL source, memoized by content.
+
+    Repeated loads of identical content (re-scans, shared fixtures) skip
+    the full lark parse. Callers must copy the result before mutating it.
+    """
+    return hcl2.loads(text, serialization_options=_SERIALIZATION_OPTS)
+
+
 def _unwrap_heredoc(value: str) -> str:
     match = _HEREDOC_RE.match(value)
     if match is None:
@@ -71,8 +123,15 @@ def _parse_op(
     *,
     source: Path | None = None,
 ) -> OperationRef:
-    """Create a single OperationRef from HCL strategy block data."""
-    return OperationRef(name=spec_name, strategy=strategy, attrs=dict(attrs), source=source)
+    """Create a single OperationRef from HCL strategy block data.
+
+    Spec names repeat across blocks and files; interning them means each
+    registry lookup starts with a pointer-equality hit and duplicates share
+    one string object.
+    """
+    return OperationRef(
+        name=sys.intern(spec_name), strategy=strategy, attrs=dict(attrs), source=source
+    )
 
 
 def _parse_ops(
@@ -114,7 +173,7 @@ def _parse_project(
     skip_keys = {"use", "include", "description"} | _STRATEGY_NAMES
     return ProjectRef(
         name=name,
-        type_name=type_name,
+        type_name=sys.intern(type_name),
         use=data.get("use", []),
         ops=_parse_ops(data, source=source),
         description=data.get("description", ""),
@@ -136,10 +195,19 @@ def _extract_variables(
     """
     resolved: dict[str, Any] = {}
 
+    # one resolver for all blocks — "var" aliases the live resolved dict, so
+    # each entry sees the variables resolved before it
+    resolver = Resolver({**context, "var": resolved})
+
     def _resolve_single(raw: Any) -> Any:
         """Resolve a single value using the current context + resolved vars."""
+        # fast path: scalars with no ${ cannot interpolate
+        if isinstance(raw, str):
+            if "${" not in raw:
+                return raw
+        elif not isinstance(raw, dict | list):
+            return raw
         # resolve() expects a dict; wrap/unwrap to resolve a single value
-        resolver = Resolver({**context, "var": resolved})
         return resolver.resolve({"_": raw})["_"]
 
     for block in data.pop("variable", []):
@@ -157,15 +225,45 @@ def _extract_variables(
     return resolved
 
 
+def _iter_hcl_files(directory: Path, *, recurse: bool) -> Iterator[Path]:
+    """Yield .hcl files under *directory* in sorted order.
+
+    Uses os.scandir directly — entry type checks come from the directory
+    read instead of a stat call per path, which is noticeably faster than
+    Path.rglob on large trees.
+    """
+    subdirs: list[Path] = []
+
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(Path(entry.path))
+            elif entry.name.endswith(".hcl") and entry.is_file():
+                yield Path(entry.path)
+
+    if recurse:
+        for subdir in subdirs:
+            yield from _iter_hcl_files(subdir, recurse=recurse)
+
+
 def parse(
     file: Path,
     *,
     context: dict[str, Any] | None = None,
 ) -> list[WorkspaceRef]:
     """Parse an HCL file into workspace refs."""
+    return _parse(file, _read_text(file), context)
+
+
+def _parse(
+    file: Path,
+    text: str,
+    context: dict[str, Any] | None,
+) -> list[WorkspaceRef]:
+    """Translate already-read HCL source into workspace refs."""
     from .projects import _project_registry
 
-    data = load(file, context=context)
+    data = _load(file, text, context)
     refs: list[WorkspaceRef] = []
 
     for block_type in data:
@@ -203,10 +301,19 @@ def scan(
         return ws
 
     logger.info("Scanning '%s' (recurse=%s)", directory, recurse)
-    glob = directory.rglob if recurse else directory.glob
 
-    for hcl_file in glob("*.hcl"):
-        ws.add(*parse(hcl_file, context=context))
+    files = list(_iter_hcl_files(directory, recurse=recurse))
+
+    # overlap file reads with a small thread pool; parsing stays serial
+    # (the lark parser is not thread-safe) and file order is preserved
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+            texts = list(pool.map(_read_text, files))
+    else:
+        texts = [_read_text(file) for file in files]
+
+    for hcl_file, text in zip(files, texts, strict=True):
+        ws.add(*_parse(hcl_file, text, context))
 
     return ws
 
@@ -217,20 +324,42 @@ def load(
     context: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Load and parse a single HCL file."""
+    return _load(file, _read_text(file), context)
+
+
+def _load(
+    file: Path,
+    text: str,
+    context: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Parse and resolve already-read HCL source."""
 
     logger.info("Loading HCL file: %s", file)
-    text = file.read_text()
 
     try:
-        data = hcl2.loads(text, serialization_options=_SERIALIZATION_OPTS)
+        data = _parse_text(text)
     except Exception as exc:
         logger.error("Could not load file: %s", file, exc_info=exc)
         raise ValueError(f"{file}: {exc}") from exc
 
-    data = _unwrap_heredocs(data)
+    # the heredoc pass rebuilds the whole tree (detaching it from the parse
+    # cache as a side effect); skip it when the source cannot contain a
+    # heredoc token at all and take a copy instead
+    if "<<" in text:
+        data = _unwrap_heredocs(data)
+    else:
+        data = deepcopy(data)
 
     base_context = context or {}
 
+    # os.environ lookups go through C-level getenv; snapshot it into a plain
+    # dict once per load so repeated ${env.X} references are single dict probes
+    if any(value is os.environ for value in base_context.values()):
+        base_context = {
+            key: dict(value) if value is os.environ else value
+            for key, value in base_context.items()
+        }
+
     try:
         variables = _extract_variables(data, base_context)
     except ValueError as exc:
@@ -245,7 +374,8 @@ def load(
     else:
         full_context = base_context
 
-    if full_context:
+    # the resolver walk is a no-op unless the source can interpolate at all
+    if full_context and "${" in text:
         resolver = Resolver(full_context)
         try:
             data = resolver.resolve(data)
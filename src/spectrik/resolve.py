@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -13,15 +14,32 @@ logger = logging.getLogger(__name__)
 _INTERP_PATTERN = re.compile(r"\$\$\{|(\$\{([^{}]+)\})")
 
 
+@lru_cache(maxsize=256)
+def _split_ref(ref: str) -> tuple[str, ...]:
+    """Split a dotted reference once; the same refs recur across files."""
+    return tuple(ref.split("."))
+
+
 class Resolver:
     """Resolve ${...} interpolation references against a context dict."""
 
     def __init__(self, context: dict[str, Any] | None = None) -> None:
         self._context = context or {}
+        self._call_cache: dict[str, Any] = {}
+        self._ref_cache: dict[str, Any] | None = None
 
     def _resolve_ref(self, ref: str) -> Any:
-        """Resolve a dotted reference (e.g., 'env.HOME') against the context."""
-        parts = ref.split(".")
+        """Resolve a dotted reference (e.g., 'env.HOME') against the context.
+
+        Callable values (e.g., a cwd provider) are invoked once per resolver
+        and memoized, so repeated references see a consistent value without
+        re-invoking the callable.
+        """
+        cache = self._ref_cache
+        if cache is not None and ref in cache:
+            return cache[ref]
+
+        parts = _split_ref(ref)
         current: Any = self._context
 
         for part in parts:
@@ -34,7 +52,13 @@ class Resolver:
                     raise ValueError(f"undefined variable '{ref}'") from None
 
         if callable(current) and not isinstance(current, type):
-            current = current()
+            if ref in self._call_cache:
+                current = self._call_cache[ref]
+            else:
+                current = self._call_cache[ref] = current()
+
+        if cache is not None:
+            cache[ref] = current
 
         return current
 
@@ -49,29 +73,67 @@ class Resolver:
         if "${" not in value:
             return value
 
-        # Check if the entire string is a single interpolation
-        match = re.fullmatch(r"\$\{([^{}]+)\}", value)
-        if match:
-            return self._resolve_ref(match.group(1).strip())
+        # GitHub Actions-style ${{ }} never resolves; when every ${ is a ${{
+        # and there is no $${ escape, the regex pass cannot change anything
+        if "$${" not in value and value.count("${") == value.count("${{"):
+            return value
+
+        # Check if the entire string is a single interpolation — group 2 is
+        # only set for a real ${ref} match (not the $${ escape)
+        match = _INTERP_PATTERN.match(value)
+        if match is not None and match.group(2) is not None and match.end() == len(value):
+            return self._resolve_ref(match.group(2).strip())
 
         # Mixed string: replace each interpolation with its stringified value
-        def _replace(m: re.Match) -> str:  # type: ignore[type-arg]
-            if m.group(0) == "$${":
-                return "${"
-            ref = m.group(2).strip()
-            return str(self._resolve_ref(ref))
+        return _INTERP_PATTERN.sub(self._replace_match, value)
 
-        return _INTERP_PATTERN.sub(_replace, value)
+    def _replace_match(self, m: re.Match) -> str:  # type: ignore[type-arg]
+        """Substitution callback for mixed-string interpolation."""
+        if m.group(0) == "$${":
+            return "${"
+        return str(self._resolve_ref(m.group(2).strip()))
 
     def resolve(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Recursively walk a parsed dict and resolve all ${...} interpolations."""
-        return self._walk(data)
-
-    def _walk(self, obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: self._walk(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [self._walk(item) for item in obj]
+        """Recursively walk a parsed dict and resolve all ${...} interpolations.
+
+        Each distinct reference is looked up once per pass; repeated
+        ``${ref}`` occurrences reuse the first result. The cache is scoped
+        to the pass, so callers that extend the context between passes
+        (e.g., variable extraction) always see current values.
+        """
+        self._ref_cache = {}
+        try:
+            return self._walk(data, {})
+        finally:
+            self._ref_cache = None
+
+    def _walk(self, obj: Any, seen: dict[int, Any]) -> Any:
+        # exact-type checks cover everything the HCL parser emits (strings
+        # being by far the most common); the isinstance fallbacks keep
+        # subclasses working for direct callers
+        cls = type(obj)
+        if cls is str:
+            # inline the no-interpolation check to skip the call entirely
+            return self._resolve_value(obj) if "${" in obj else obj
+        # containers aliased into the tree more than once resolve a single
+        # time; input objects stay alive for the pass, so ids are stable
+        if cls is dict or isinstance(obj, dict):
+            resolved = seen.get(id(obj))
+            if resolved is None:
+                out = {k: self._walk(v, seen) for k, v in obj.items()}
+                # copy-on-write: keep the original when nothing resolved
+                if all(out[k] is v for k, v in obj.items()):
+                    out = obj
+                resolved = seen[id(obj)] = out
+            return resolved
+        if cls is list or isinstance(obj, list):
+            resolved = seen.get(id(obj))
+            if resolved is None:
+                out = [self._walk(item, seen) for item in obj]
+                if all(new is old for new, old in zip(out, obj, strict=True)):
+                    out = obj
+                resolved = seen[id(obj)] = out
+            return resolved
         if isinstance(obj, str):
             return self._resolve_value(obj)
         return obj
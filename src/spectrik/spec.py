@@ -22,6 +22,9 @@ def spec(name: str):
 class Specification[P](ABC):
     """Base class for all configuration specs."""
 
+    # no state of its own — lets subclasses opt into __slots__ if they choose
+    __slots__ = ()
+
     def equals(self, ctx: Context[P]) -> bool:
         """Current state matches desired state.
 
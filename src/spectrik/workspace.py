@@ -12,7 +12,6 @@ from typing import Any, Self, overload
 
 from .blueprints import Blueprint
 from .projects import Project
-from .spec import _spec_registry
 from .specop import Absent, Ensure, Present, SpecOp
 
 logger = logging.getLogger(__name__)
@@ -24,7 +23,7 @@ _STRATEGY_MAP: dict[str, type[SpecOp]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceRef(ABC):
     """Base class for all workspace references."""
 
@@ -35,7 +34,7 @@ class WorkspaceRef(ABC):
         """Return a ready-to-use instance using the workspace as context."""
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationRef(WorkspaceRef):
     """A configuration operation — a spec type + strategy + attributes."""
 
@@ -45,21 +44,22 @@ class OperationRef(WorkspaceRef):
     source: Path | None = None
 
     def resolve(self, workspace: Workspace) -> SpecOp:
-        if self.name not in _spec_registry:
+        from .spec import _spec_registry
+
+        spec_cls = _spec_registry.get(self.name)
+        if spec_cls is None:
             msg = f"Unknown spec type: '{self.name}'"
             if self.source is not None:
                 msg += f" in {self.source}"
             msg += " — ensure the module registering this spec is imported"
             raise ValueError(msg)
-        if self.strategy not in _STRATEGY_MAP:
+        strategy_cls = _STRATEGY_MAP.get(self.strategy)
+        if strategy_cls is None:
             raise ValueError(f"Unknown strategy: '{self.strategy}'")
-        spec_cls = _spec_registry[self.name]
-        spec_instance = spec_cls(**self.attrs)
-        strategy_cls = _STRATEGY_MAP[self.strategy]
-        return strategy_cls(spec_instance)
+        return strategy_cls(spec_cls(**self.attrs))
 
 
-@dataclass
+@dataclass(slots=True)
 class BlueprintRef(WorkspaceRef):
     """A blueprint reference — a named collection of operations with optional includes."""
 
@@ -68,27 +68,41 @@ class BlueprintRef(WorkspaceRef):
     description: str = ""
 
     def resolve(self, workspace: Workspace) -> Blueprint:
-        return self._resolve(workspace, set())
+        ops = self._closure(workspace, set())
+        # ops are freshly-built SpecOps, so skip pydantic validation here
+        return Blueprint.model_construct(name=self.name, ops=[op.resolve(workspace) for op in ops])
+
+    def _closure(self, workspace: Workspace, resolving: set[str]) -> list[OperationRef]:
+        """Flatten the include graph into an ordered list of operation refs.
+
+        The flattened list is cached on the workspace (and invalidated when
+        refs are added), so repeated resolution skips the graph walk while
+        still producing fresh spec instances each time.
+        """
+        cached = workspace._closure_cache.get(self.name)
+        if cached is not None and workspace.blueprints.get(self.name) is self:
+            return cached
 
-    def _resolve(self, workspace: Workspace, resolving: set[str]) -> Blueprint:
         if self.name in resolving:
             raise ValueError(f"Circular include detected: '{self.name}'")
         resolving.add(self.name)
 
-        all_ops: list[SpecOp] = []
+        ops: list[OperationRef] = []
 
         for inc_name in self.includes:
-            included_ref = workspace.blueprints[inc_name]
-            included_bp = included_ref._resolve(workspace, resolving)
-            all_ops.extend(included_bp.ops)
+            ops.extend(workspace.blueprints[inc_name]._closure(workspace, resolving))
 
-        all_ops.extend(op.resolve(workspace) for op in self.ops)
+        ops.extend(self.ops)
 
         resolving.discard(self.name)
-        return Blueprint(name=self.name, ops=all_ops)
 
+        if workspace.blueprints.get(self.name) is self:
+            workspace._closure_cache[self.name] = ops
+
+        return ops
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectRef(WorkspaceRef):
     """A project reference — a named build target with blueprints and inline ops."""
 
@@ -99,6 +113,12 @@ class ProjectRef(WorkspaceRef):
     attrs: dict[str, Any] = field(default_factory=dict)
 
     def resolve(self, workspace: Workspace) -> Project:
+        """Materialize a fully-built Project, resolving blueprints eagerly.
+
+        Laziness lives in the Workspace mapping (refs resolve on access);
+        the returned Project is deliberately concrete and self-contained,
+        with no ties back to the workspace it came from.
+        """
         from .projects import _project_registry
 
         if self.type_name not in _project_registry:
@@ -117,7 +137,7 @@ class ProjectRef(WorkspaceRef):
 
         inline_ops = [op.resolve(workspace) for op in self.ops]
         if inline_ops:
-            blueprints.append(Blueprint(name=f"{self.name}:inline", ops=inline_ops))
+            blueprints.append(Blueprint.model_construct(name=f"{self.name}:inline", ops=inline_ops))
 
         return project_cls(
             name=self.name,
@@ -130,9 +150,12 @@ class ProjectRef(WorkspaceRef):
 class Workspace(Mapping[str, Project]):
     """Configured workspace that holds refs and resolves projects on access."""
 
+    __slots__ = ("_blueprint_refs", "_project_refs", "_closure_cache")
+
     def __init__(self) -> None:
         self._blueprint_refs: dict[str, BlueprintRef] = {}
         self._project_refs: dict[str, ProjectRef] = {}
+        self._closure_cache: dict[str, list[OperationRef]] = {}
 
     @property
     def blueprints(self) -> Mapping[str, BlueprintRef]:
@@ -151,6 +174,7 @@ class Workspace(Mapping[str, Project]):
                         raise ValueError(f"Duplicate blueprint: '{ref.name}'")
                     logger.debug("Added blueprint '%s'", ref.name)
                     self._blueprint_refs[ref.name] = ref
+                    self._closure_cache.clear()
                 case ProjectRef():
                     if ref.name in self._project_refs:
                         raise ValueError(f"Duplicate project: '{ref.name}'")
@@ -185,9 +209,10 @@ class Workspace(Mapping[str, Project]):
     @overload
     def get(self, name: str, default: None) -> Project | None: ...
     def get(self, name: str, default: Any = None) -> Project | None:
-        if name not in self._project_refs:
+        ref = self._project_refs.get(name)
+        if ref is None:
             return default
-        return self._project_refs[name].resolve(self)
+        return ref.resolve(self)
 
     def filter(self, names: Iterable[str]) -> list[Project]:
         """Return projects matching the given names, preserving input order.
@@ -225,7 +250,9 @@ class Workspace(Mapping[str, Project]):
 
         if target_names is not None:
             projects = [
-                self._project_refs[n].resolve(self) for n in target_names if n in self._project_refs
+                ref.resolve(self)
+                for n in target_names
+                if (ref := self._project_refs.get(n)) is not None
             ]
         else:
             projects = list(self.values())
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from importlib import import_module
 from pathlib import Path
 
 import pytest
@@ -9,13 +11,24 @@ import pytest
 from spectrik.context import Context
 from spectrik.hcl import load, parse, scan
 from spectrik.projects import Project, _project_registry, project
-from spectrik.spec import Specification, _spec_registry
-from spectrik.workspace import BlueprintRef, ProjectRef, Workspace
+from spectrik.spec import Specification
+from spectrik.workspace import BlueprintRef, ProjectRef, Workspace, WorkspaceRef
+
+# the package re-exports the spec() decorator under the same name as the
+# module, so reach the modules themselves through importlib
+spec_module = import_module("spectrik.spec")
+projects_module = import_module("spectrik.projects")
+
+# everything in this module round-trips HCL through real files; deselect
+# with `pytest -m "not io"` for a fast, disk-free run
+pytestmark = pytest.mark.io
 
 # -- Test fixtures --
 
 
 class TrackingSpec(Specification["Project"]):
+    __slots__ = ("kwargs", "applied")
+
     def __init__(self, **kwargs):
         self.kwargs = kwargs
         self.applied = False
@@ -30,97 +43,109 @@ class TrackingSpec(Specification["Project"]):
         pass
 
 
+# Static, read-only contents shared across tests. Each file lives in its
+# own subdirectory so scan() tests can target it in isolation.
+_CORPUS_FILES = {
+    "simple_project": """
+        project "myproj" { description = "test" }
+    """,
+    "plain_project": """
+        project "p" {
+            description = "plain"
+        }
+    """,
+    "greeting_project": """
+        project "p" {
+            description = "${greeting}"
+        }
+    """,
+    "blueprint": """
+        blueprint "my-bp" {
+            ensure "widget" {
+                color = "red"
+            }
+        }
+    """,
+    "blueprint_and_project": """
+        blueprint "base" {
+            ensure "widget" { color = "red" }
+        }
+        project "myproj" {
+            use = ["base"]
+        }
+    """,
+}
+
+
+@pytest.fixture(scope="module")
+def hcl_corpus(tmp_path_factory) -> dict[str, Path]:
+    """Write the shared read-only HCL corpus once per module."""
+    root = tmp_path_factory.mktemp("hcl-corpus")
+    corpus: dict[str, Path] = {}
+    for name, content in _CORPUS_FILES.items():
+        corpus[name] = _write_hcl(root, name, f"{name}.hcl", content)
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def scan_tree(tmp_path_factory) -> Path:
+    """A small nested tree written once and shared by the read-only scan tests."""
+    root = tmp_path_factory.mktemp("scan-tree")
+    _write_hcl(root, ".", "top.hcl", 'project "top" { description = "top" }')
+    _write_hcl(root, "sub", "nested.hcl", 'project "nested" { description = "nested" }')
+    return root
+
+
+@pytest.fixture(scope="module")
+def corpus_refs(hcl_corpus) -> dict[str, list[WorkspaceRef]]:
+    """Parse the static corpus once per module; tests treat refs as read-only."""
+    return {name: parse(file) for name, file in hcl_corpus.items()}
+
+
 def _write_hcl(tmp_path: Path, subdir: str, filename: str, content: str) -> Path:
     d = tmp_path / subdir
     d.mkdir(parents=True, exist_ok=True)
     f = d / filename
-    f.write_text(content)
+    # raw os-level write — skips Path/TextIOWrapper overhead for the many
+    # small fixture files this module creates
+    fd = os.open(f, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
     return f
 
 
 @pytest.fixture(autouse=True)
-def _clean_registry():
-    """Clear spec registry before and after each test."""
-    saved = _spec_registry.copy()
-    _spec_registry.clear()
-
-    # Register our test spec
-    _spec_registry["widget"] = TrackingSpec
-
-    yield
-
-    _spec_registry.clear()
-    _spec_registry.update(saved)
+def _clean_registry(monkeypatch):
+    """Swap in a fresh spec registry for each test (no dict copies)."""
+    monkeypatch.setattr(spec_module, "_spec_registry", {"widget": TrackingSpec})
 
 
 @pytest.fixture(autouse=True)
-def _clean_project_registry():
-    saved = _project_registry.copy()
-    yield
-    _project_registry.clear()
-    _project_registry.update(saved)
+def _clean_project_registry(monkeypatch):
+    """Swap in a copy of the project registry; restore is a single rebind."""
+    monkeypatch.setattr(projects_module, "_project_registry", dict(_project_registry))
 
 
 # -- Low-level API tests --
 
 
 class TestLoad:
-    def test_load_single_file(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            blueprint "my-bp" {
-                ensure "widget" {
-                    color = "red"
-                }
-            }
-        """,
-        )
-        result = load(tmp_path / "test.hcl")
+    def test_load_single_file(self, hcl_corpus):
+        result = load(hcl_corpus["blueprint"])
         assert "blueprint" in result
 
-    def test_load_with_context_renders_variables(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "p" {
-                description = "${greeting}"
-            }
-        """,
-        )
-        result = load(tmp_path / "test.hcl", context={"greeting": "hello"})
+    def test_load_with_context_renders_variables(self, hcl_corpus):
+        result = load(hcl_corpus["greeting_project"], context={"greeting": "hello"})
         assert result["project"][0]["p"]["description"] == "hello"
 
-    def test_load_without_context_passes_through(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "p" {
-                description = "plain"
-            }
-        """,
-        )
-        result = load(tmp_path / "test.hcl")
+    def test_load_without_context_passes_through(self, hcl_corpus):
+        result = load(hcl_corpus["plain_project"])
         assert result["project"][0]["p"]["description"] == "plain"
 
-    def test_load_empty_context_passes_through(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "p" {
-                description = "plain"
-            }
-        """,
-        )
-        result = load(tmp_path / "test.hcl", context={})
+    def test_load_empty_context_passes_through(self, hcl_corpus):
+        result = load(hcl_corpus["plain_project"], context={})
         assert result["project"][0]["p"]["description"] == "plain"
 
     def test_load_strips_comment_metadata(self, tmp_path):
@@ -216,20 +241,26 @@ EOT
             load(tmp_path / "bad.hcl", context={"something_else": "x"})
 
 
+class TestLoadCache:
+    """The parse stage is memoized by content; loads must stay independent."""
+
+    def test_repeated_load_returns_independent_data(self, hcl_corpus):
+        first = load(hcl_corpus["blueprint_and_project"])
+        second = load(hcl_corpus["blueprint_and_project"])
+        assert first == second
+
+        # mutating one result must not leak into later loads of the same content
+        first["blueprint"][0]["base"]["ensure"][0]["widget"]["color"] = "blue"
+        third = load(hcl_corpus["blueprint_and_project"])
+        assert third == second
+
+
 # -- hcl.scan() convenience function tests --
 
 
 class TestScan:
-    def test_scan_returns_workspace(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "myproj" { description = "test" }
-        """,
-        )
-        ws = scan(tmp_path)
+    def test_scan_returns_workspace(self, hcl_corpus):
+        ws = scan(hcl_corpus["simple_project"].parent)
         assert isinstance(ws, Workspace)
         assert "myproj" in ws
 
@@ -255,48 +286,23 @@ class TestScan:
         assert isinstance(proj, SampleProject)
         assert proj.repo == "owner/repo"
 
-    def test_scan_recurse_true(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "top.hcl",
-            """
-            project "top" { description = "top" }
-        """,
-        )
-        _write_hcl(
-            tmp_path,
-            "sub",
-            "nested.hcl",
-            """
-            project "nested" { description = "nested" }
-        """,
-        )
-        ws = scan(tmp_path, recurse=True)
+    def test_scan_recurse_true(self, scan_tree):
+        ws = scan(scan_tree, recurse=True)
         assert "top" in ws
         assert "nested" in ws
 
-    def test_scan_recurse_false(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "top.hcl",
-            """
-            project "top" { description = "top" }
-        """,
-        )
-        _write_hcl(
-            tmp_path,
-            "sub",
-            "nested.hcl",
-            """
-            project "nested" { description = "nested" }
-        """,
-        )
-        ws = scan(tmp_path, recurse=False)
+    def test_scan_recurse_false(self, scan_tree):
+        ws = scan(scan_tree, recurse=False)
         assert "top" in ws
         assert "nested" not in ws
 
+    def test_scan_sorted_order(self, tmp_path):
+        """Files are scanned in sorted name order regardless of creation order."""
+        _write_hcl(tmp_path, ".", "zz.hcl", 'project "from-zz" { description = "z" }')
+        _write_hcl(tmp_path, ".", "aa.hcl", 'project "from-aa" { description = "a" }')
+        ws = scan(tmp_path)
+        assert list(ws) == ["from-aa", "from-zz"]
+
     def test_scan_empty_dir(self, tmp_path):
         ws = scan(tmp_path)
         assert len(ws) == 0
@@ -305,35 +311,12 @@ class TestScan:
         ws = scan(tmp_path / "nonexistent")
         assert len(ws) == 0
 
-    def test_scan_with_context(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "p" {
-                description = "${greeting}"
-            }
-        """,
-        )
-        ws = scan(tmp_path, context={"greeting": "hello"})
+    def test_scan_with_context(self, hcl_corpus):
+        ws = scan(hcl_corpus["greeting_project"].parent, context={"greeting": "hello"})
         assert ws["p"].description == "hello"
 
-    def test_scan_with_blueprints_and_projects(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            blueprint "base" {
-                ensure "widget" { color = "red" }
-            }
-            project "myproj" {
-                use = ["base"]
-            }
-        """,
-        )
-        ws = scan(tmp_path)
+    def test_scan_with_blueprints_and_projects(self, hcl_corpus):
+        ws = scan(hcl_corpus["blueprint_and_project"].parent)
         assert len(ws["myproj"].blueprints) == 1
 
     def test_scan_with_variables(self, tmp_path):
@@ -388,61 +371,26 @@ class TestScan:
 
 
 class TestParse:
-    def test_parse_project(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "myproj" {
-                description = "A test project"
-            }
-        """,
-        )
-        refs = parse(tmp_path / "test.hcl")
+    def test_parse_project(self, corpus_refs):
+        refs = corpus_refs["simple_project"]
         assert len(refs) == 1
         ref = refs[0]
         assert isinstance(ref, ProjectRef)
         assert ref.name == "myproj"
-        assert ref.description == "A test project"
+        assert ref.description == "test"
 
-    def test_parse_blueprint(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            blueprint "base" {
-                ensure "widget" {
-                    color = "red"
-                }
-            }
-        """,
-        )
-        refs = parse(tmp_path / "test.hcl")
+    def test_parse_blueprint(self, corpus_refs):
+        refs = corpus_refs["blueprint"]
         assert len(refs) == 1
         ref = refs[0]
         assert isinstance(ref, BlueprintRef)
-        assert ref.name == "base"
+        assert ref.name == "my-bp"
         assert len(ref.ops) == 1
         assert ref.ops[0].strategy == "ensure"
         assert ref.ops[0].name == "widget"
 
-    def test_parse_blueprint_and_project(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            blueprint "base" {
-                ensure "widget" { color = "red" }
-            }
-            project "myproj" {
-                use = ["base"]
-            }
-        """,
-        )
-        refs = parse(tmp_path / "test.hcl")
+    def test_parse_blueprint_and_project(self, corpus_refs):
+        refs = corpus_refs["blueprint_and_project"]
         assert len(refs) == 2
         bp_refs = [r for r in refs if isinstance(r, BlueprintRef)]
         proj_refs = [r for r in refs if isinstance(r, ProjectRef)]
@@ -450,18 +398,8 @@ class TestParse:
         assert len(proj_refs) == 1
         assert proj_refs[0].use == ["base"]
 
-    def test_parse_with_context(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "p" {
-                description = "${greeting}"
-            }
-        """,
-        )
-        refs = parse(tmp_path / "test.hcl", context={"greeting": "hello"})
+    def test_parse_with_context(self, hcl_corpus):
+        refs = parse(hcl_corpus["greeting_project"], context={"greeting": "hello"})
         assert len(refs) == 1
         assert isinstance(refs[0], ProjectRef)
         assert refs[0].description == "hello"
@@ -574,19 +512,9 @@ class TestParse:
 class TestInterpolation:
     """Test ${...} interpolation in HCL files."""
 
-    def test_simple_variable(self, tmp_path):
-        _write_hcl(
-            tmp_path,
-            ".",
-            "test.hcl",
-            """
-            project "app" {
-                description = "${greeting}"
-            }
-        """,
-        )
-        result = load(tmp_path / "test.hcl", context={"greeting": "hello"})
-        assert result["project"][0]["app"]["description"] == "hello"
+    def test_simple_variable(self, hcl_corpus):
+        result = load(hcl_corpus["greeting_project"], context={"greeting": "hello"})
+        assert result["project"][0]["p"]["description"] == "hello"
 
     def test_dotted_reference(self, tmp_path):
         _write_hcl(
@@ -647,20 +575,26 @@ class TestInterpolation:
         with pytest.raises(ValueError, match=str(tmp_path)):
             load(tmp_path / "test.hcl", context={"other": "x"})
 
-    def test_no_context_leaves_dollar_braces(self, tmp_path):
-        """Without context, ${...} strings pass through from hcl2 as-is."""
+    def test_environ_as_context(self, tmp_path, monkeypatch):
+        """Passing os.environ directly as a context value resolves env refs."""
+        monkeypatch.setenv("SPECTRIK_TEST_HOME", "/srv/app")
         _write_hcl(
             tmp_path,
             ".",
             "test.hcl",
             """
             project "app" {
-                description = "${name}"
+                description = "${env.SPECTRIK_TEST_HOME}/data"
             }
         """,
         )
-        result = load(tmp_path / "test.hcl")
-        assert result["project"][0]["app"]["description"] == "${name}"
+        result = load(tmp_path / "test.hcl", context={"env": os.environ})
+        assert result["project"][0]["app"]["description"] == "/srv/app/data"
+
+    def test_no_context_leaves_dollar_braces(self, hcl_corpus):
+        """Without context, ${...} strings pass through from hcl2 as-is."""
+        result = load(hcl_corpus["greeting_project"])
+        assert result["project"][0]["p"]["description"] == "${greeting}"
 
     def test_nested_in_list(self, tmp_path):
         """Interpolation works inside list values."""
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+from importlib import import_module
 from pathlib import Path
 
+import pytest
+
 import spectrik.hcl as hcl
 from spectrik import Blueprint, Context, Ensure, Project, Specification
-from spectrik.projects import _project_registry, project
-from spectrik.spec import _spec_registry
+from spectrik.projects import project
+
+# the package re-exports decorators under the same names as their modules,
+# so reach the modules themselves through importlib
+spec_module = import_module("spectrik.spec")
+projects_module = import_module("spectrik.projects")
+
+# the pipeline tests here scan HCL from real files; deselect with
+# `pytest -m "not io"` for a fast, disk-free run
+pytestmark = pytest.mark.io
 
 
 @project("app")
@@ -16,6 +27,8 @@ class AppProject(Project):
 
 
 class CountingSpec(Specification["AppProject"]):
+    __slots__ = ("kwargs",)
+
     apply_count = 0
     remove_count = 0
 
@@ -41,17 +54,13 @@ def _write_hcl(tmp_path: Path, filename: str, content: str) -> Path:
 
 
 class TestEndToEnd:
-    def setup_method(self):
-        self._saved_specs = _spec_registry.copy()
-        _spec_registry.clear()
-        _spec_registry["counter"] = CountingSpec
-        self._saved_projects = _project_registry.copy()
-
-    def teardown_method(self):
-        _spec_registry.clear()
-        _spec_registry.update(self._saved_specs)
-        _project_registry.clear()
-        _project_registry.update(self._saved_projects)
+    @pytest.fixture(autouse=True)
+    def _clean_registries(self, monkeypatch):
+        """Swap in fresh registries for each test (no dict copies)."""
+        monkeypatch.setattr(spec_module, "_spec_registry", {"counter": CountingSpec})
+        monkeypatch.setattr(
+            projects_module, "_project_registry", dict(projects_module._project_registry)
+        )
 
     def test_full_pipeline(self, tmp_path):
         """Load HCL via Workspace, build project, verify specs executed."""
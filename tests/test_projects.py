@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+
 import pytest
 
 from spectrik.blueprints import Blueprint
@@ -9,7 +11,6 @@ from spectrik.context import Context
 from spectrik.projects import (
     Project,
     _collect_hooks,
-    _project_registry,
     post_build,
     pre_build,
     project,
@@ -17,13 +18,17 @@ from spectrik.projects import (
 from spectrik.spec import Specification
 from spectrik.specop import Ensure
 
+# the package re-exports project() under the same name as its module, so
+# reach the module itself through importlib
+projects_module = import_module("spectrik.projects")
+
 
 @pytest.fixture(autouse=True)
-def _clean_project_registry():
-    saved = _project_registry.copy()
-    yield
-    _project_registry.clear()
-    _project_registry.update(saved)
+def _clean_project_registry(monkeypatch):
+    """Swap in a disposable copy of the project registry for each test."""
+    monkeypatch.setattr(
+        projects_module, "_project_registry", dict(projects_module._project_registry)
+    )
 
 
 class FailingSpec(Specification["Project"]):
@@ -38,6 +43,8 @@ class FailingSpec(Specification["Project"]):
 
 
 class TrackingSpec(Specification["Project"]):
+    __slots__ = ("applied", "received_project")
+
     def __init__(self):
         self.applied = False
 
@@ -144,16 +151,16 @@ class TestProject:
 
 class TestProjectDecorator:
     def test_base_project_registered(self):
-        assert "project" in _project_registry
-        assert _project_registry["project"] is Project
+        assert "project" in projects_module._project_registry
+        assert projects_module._project_registry["project"] is Project
 
     def test_register_custom_type(self):
         @project("railway")
         class RailwayProject(Project):
             token: str = ""
 
-        assert "railway" in _project_registry
-        assert _project_registry["railway"] is RailwayProject
+        assert "railway" in projects_module._project_registry
+        assert projects_module._project_registry["railway"] is RailwayProject
 
     def test_decorator_returns_class_unchanged(self):
         @project("custom")
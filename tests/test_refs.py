@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+
 import pytest
 
 from spectrik.context import Context
-from spectrik.projects import Project, _project_registry, project
-from spectrik.spec import Specification, _spec_registry
+from spectrik.projects import Project, project
+from spectrik.spec import Specification
 from spectrik.specop import Absent, Ensure, Present
 from spectrik.workspace import BlueprintRef, OperationRef, ProjectRef, Workspace
 
+# the package re-exports decorators under the same names as their modules,
+# so reach the modules themselves through importlib
+spec_module = import_module("spectrik.spec")
+projects_module = import_module("spectrik.projects")
+
 
 class TrackingSpec(Specification["Project"]):
+    __slots__ = ("kwargs",)
+
     def __init__(self, **kwargs):
         self.kwargs = kwargs
 
@@ -26,16 +35,12 @@ class TrackingSpec(Specification["Project"]):
 
 
 @pytest.fixture(autouse=True)
-def _clean_registry():
-    saved_specs = _spec_registry.copy()
-    _spec_registry.clear()
-    _spec_registry["widget"] = TrackingSpec
-    saved_projects = _project_registry.copy()
-    yield
-    _spec_registry.clear()
-    _spec_registry.update(saved_specs)
-    _project_registry.clear()
-    _project_registry.update(saved_projects)
+def _clean_registry(monkeypatch):
+    """Swap in fresh registries for each test (no dict copies)."""
+    monkeypatch.setattr(spec_module, "_spec_registry", {"widget": TrackingSpec})
+    monkeypatch.setattr(
+        projects_module, "_project_registry", dict(projects_module._project_registry)
+    )
 
 
 class TestOperationRef:
@@ -123,6 +128,22 @@ class TestBlueprintRef:
         assert bp.name == "extended"
         assert len(bp.ops) == 2
 
+    def test_resolve_twice_produces_fresh_ops(self):
+        """Repeated resolution reuses the include closure but not spec instances."""
+        base_op = OperationRef(name="widget", strategy="ensure", attrs={"color": "red"})
+        base_ref = BlueprintRef(name="base", includes=[], ops=[base_op])
+        ext_ref = BlueprintRef(name="extended", includes=["base"], ops=[])
+
+        ws = Workspace()
+        ws.add(base_ref)
+        ws.add(ext_ref)
+
+        bp1 = ext_ref.resolve(ws)
+        bp2 = ext_ref.resolve(ws)
+        assert len(bp1.ops) == len(bp2.ops) == 1
+        assert bp1.ops[0] is not bp2.ops[0]
+        assert bp1.ops[0].spec is not bp2.ops[0].spec
+
     def test_resolve_circular_include_raises(self):
         ref_a = BlueprintRef(name="a", includes=["b"], ops=[])
         ref_b = BlueprintRef(name="b", includes=["a"], ops=[])
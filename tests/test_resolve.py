@@ -41,6 +41,18 @@ class TestResolveRef:
         r = Resolver({"cwd": lambda: "/tmp/work"})
         assert r._resolve_ref("cwd") == "/tmp/work"
 
+    def test_callable_invoked_once_per_resolver(self):
+        calls: list[int] = []
+
+        def cwd() -> str:
+            calls.append(1)
+            return "/tmp/work"
+
+        r = Resolver({"cwd": cwd})
+        data = {"a": "${cwd}/x", "b": "${cwd}/y"}
+        assert r.resolve(data) == {"a": "/tmp/work/x", "b": "/tmp/work/y"}
+        assert len(calls) == 1
+
     def test_callable_not_invoked_on_intermediate(self):
         """Callables at intermediate positions are not invoked during traversal."""
         r = Resolver({"get_value": lambda: "result"})
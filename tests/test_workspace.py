@@ -3,39 +3,45 @@
 from __future__ import annotations
 
 import warnings
+from importlib import import_module
 
 import pytest
 
 from spectrik.context import Context
-from spectrik.projects import Project, _project_registry, project
-from spectrik.spec import Specification, _spec_registry
+from spectrik.projects import Project, project
+from spectrik.spec import Specification
 from spectrik.workspace import BlueprintRef, OperationRef, ProjectRef, Workspace
 
+# the package re-exports decorators under the same names as their modules,
+# so reach the modules themselves through importlib
+spec_module = import_module("spectrik.spec")
+projects_module = import_module("spectrik.projects")
+
 
 class TestWorkspaceConstruction:
-    def test_empty_workspace_len(self):
-        ws = Workspace()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ws(cls) -> Workspace:
+        """One empty workspace shared by these read-only tests."""
+        return Workspace()
+
+    def test_empty_workspace_len(self, ws):
         assert len(ws) == 0
 
-    def test_empty_workspace_iter(self):
-        ws = Workspace()
+    def test_empty_workspace_iter(self, ws):
         assert list(ws) == []
 
-    def test_empty_workspace_contains(self):
-        ws = Workspace()
+    def test_empty_workspace_contains(self, ws):
         assert "anything" not in ws
 
-    def test_getitem_empty_raises(self):
-        ws = Workspace()
+    def test_getitem_empty_raises(self, ws):
         with pytest.raises(KeyError):
             ws["missing"]
 
-    def test_get_empty_returns_none(self):
-        ws = Workspace()
+    def test_get_empty_returns_none(self, ws):
         assert ws.get("missing") is None
 
-    def test_repr_empty(self):
-        ws = Workspace()
+    def test_repr_empty(self, ws):
         assert "Workspace" in repr(ws)
         assert "blueprints=0" in repr(ws)
         assert "projects=0" in repr(ws)
@@ -45,6 +51,8 @@ class TestWorkspaceConstruction:
 
 
 class TrackingSpec(Specification["Project"]):
+    __slots__ = ("kwargs",)
+
     def __init__(self, **kwargs):
         self.kwargs = kwargs
 
@@ -59,21 +67,17 @@ class TrackingSpec(Specification["Project"]):
 
 
 @pytest.fixture()
-def _clean_registry():
-    saved = _spec_registry.copy()
-    _spec_registry.clear()
-    _spec_registry["widget"] = TrackingSpec
-    yield
-    _spec_registry.clear()
-    _spec_registry.update(saved)
+def _clean_registry(monkeypatch):
+    """Swap in a fresh spec registry for the test (no dict copies)."""
+    monkeypatch.setattr(spec_module, "_spec_registry", {"widget": TrackingSpec})
 
 
 @pytest.fixture(autouse=True)
-def _clean_project_registry():
-    saved = _project_registry.copy()
-    yield
-    _project_registry.clear()
-    _project_registry.update(saved)
+def _clean_project_registry(monkeypatch):
+    """Swap in a disposable copy of the project registry for each test."""
+    monkeypatch.setattr(
+        projects_module, "_project_registry", dict(projects_module._project_registry)
+    )
 
 
 class TestWorkspaceAdd:
@@ -142,49 +146,45 @@ class TestWorkspaceAdd:
         assert result is ws
 
 
+# built once at import — resolve() never mutates a ref and each test gets
+# its own Workspace, so one set of instances serves every mapping test
+_MAPPING_REFS = (
+    ProjectRef(name="a", use=[], ops=[], description="alpha"),
+    ProjectRef(name="b", use=[], ops=[], description="beta"),
+    ProjectRef(name="c", use=[], ops=[], description="gamma"),
+)
+
+
 class TestWorkspaceMapping:
     """Test Mapping protocol with refs constructed directly."""
 
-    def test_values(self):
+    @pytest.fixture()
+    def ws(self) -> Workspace:
+        """A workspace pre-populated with three plain projects (a, b, c)."""
         ws = Workspace()
-        ws.add(
-            ProjectRef(name="a", use=[], ops=[], description="alpha"),
-            ProjectRef(name="b", use=[], ops=[], description="beta"),
-        )
+        ws.add(*_MAPPING_REFS)
+        return ws
+
+    def test_values(self, ws):
         names = sorted(p.name for p in ws.values())
-        assert names == ["a", "b"]
+        assert names == ["a", "b", "c"]
 
-    def test_items(self):
-        ws = Workspace()
-        ws.add(ProjectRef(name="a", use=[], ops=[], description="alpha"))
+    def test_items(self, ws):
         pairs = list(ws.items())
-        assert len(pairs) == 1
+        assert len(pairs) == 3
         assert pairs[0][0] == "a"
         assert pairs[0][1].description == "alpha"
 
-    def test_keys(self):
-        ws = Workspace()
-        ws.add(
-            ProjectRef(name="a", use=[], ops=[], description="alpha"),
-            ProjectRef(name="b", use=[], ops=[], description="beta"),
-        )
-        assert sorted(ws.keys()) == ["a", "b"]
+    def test_keys(self, ws):
+        assert sorted(ws.keys()) == ["a", "b", "c"]
 
-    def test_fresh_resolution_each_access(self):
-        ws = Workspace()
-        ws.add(ProjectRef(name="a", use=[], ops=[], description="alpha"))
+    def test_fresh_resolution_each_access(self, ws):
         proj1 = ws["a"]
         proj2 = ws["a"]
         assert proj1 is not proj2
         assert proj1.name == proj2.name
 
-    def test_filter(self):
-        ws = Workspace()
-        ws.add(
-            ProjectRef(name="a", use=[], ops=[], description="alpha"),
-            ProjectRef(name="b", use=[], ops=[], description="beta"),
-            ProjectRef(name="c", use=[], ops=[], description="gamma"),
-        )
+    def test_filter(self, ws):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
             result = ws.filter(["a", "c"])
@@ -195,9 +195,7 @@ class TestWorkspaceMapping:
         assert result[0].name == "a"
         assert result[1].name == "c"
 
-    def test_filter_skips_missing(self):
-        ws = Workspace()
-        ws.add(ProjectRef(name="a", use=[], ops=[], description="alpha"))
+    def test_filter_skips_missing(self, ws):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
             result = ws.filter(["a", "missing"])
@@ -205,48 +203,28 @@ class TestWorkspaceMapping:
             assert issubclass(w[0].category, DeprecationWarning)
         assert len(result) == 1
 
-    def test_filter_empty_names(self):
-        ws = Workspace()
-        ws.add(ProjectRef(name="a", use=[], ops=[], description="alpha"))
+    def test_filter_empty_names(self, ws):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
             assert ws.filter([]) == []
             assert len(w) == 1
             assert issubclass(w[0].category, DeprecationWarning)
 
-    def test_select_with_names(self):
-        ws = Workspace()
-        ws.add(
-            ProjectRef(name="a", use=[], ops=[], description="alpha"),
-            ProjectRef(name="b", use=[], ops=[], description="beta"),
-            ProjectRef(name="c", use=[], ops=[], description="gamma"),
-        )
+    def test_select_with_names(self, ws):
         result = ws.select(names=["a", "c"])
         assert len(result) == 2
         assert result[0].name == "a"
         assert result[1].name == "c"
 
-    def test_select_without_names(self):
-        ws = Workspace()
-        ws.add(
-            ProjectRef(name="a", use=[], ops=[], description="alpha"),
-            ProjectRef(name="b", use=[], ops=[], description="beta"),
-        )
+    def test_select_without_names(self, ws):
         result = ws.select()
-        assert len(result) == 2
+        assert len(result) == 3
 
-    def test_select_with_none(self):
-        ws = Workspace()
-        ws.add(
-            ProjectRef(name="a", use=[], ops=[], description="alpha"),
-            ProjectRef(name="b", use=[], ops=[], description="beta"),
-        )
+    def test_select_with_none(self, ws):
         result = ws.select()
-        assert len(result) == 2
+        assert len(result) == 3
 
-    def test_select_with_empty_list(self):
-        ws = Workspace()
-        ws.add(ProjectRef(name="a", use=[], ops=[], description="alpha"))
+    def test_select_with_empty_list(self, ws):
         result = ws.select(names=[])
         assert len(result) == 0
 